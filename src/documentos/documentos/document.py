@@ -53,6 +53,8 @@ class MarkdownDocument:
 
     contents: list(str)
         - The contents of the markdown file line-by-line
+        - It is a plain list of lines, each line keeps its line ending.
+          The tools replace, extend and edit it in place by line number.
 
     headers: dict
         - A dictionary keyed by the ATX header depth (1 to 6) with a
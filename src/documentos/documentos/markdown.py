@@ -645,6 +645,7 @@ def extract_all_markdown_links(contents, **kwargs):
     md_link_rule = MarkdownLinkRule()
     absolute_url_rule = AbsoluteURLRule()
     relative_url_rule = RelativeMarkdownURLRule()
+    image_rule = MarkdownImageRule()
 
     all_links = []
     absolute_links = []
@@ -653,10 +654,19 @@ def extract_all_markdown_links(contents, **kwargs):
 
     for i, line in markdown_outside_fence(contents):
 
+        # Both markdown links and image links contain `](`. Most lines
+        # don't have any links, and a substring test is a lot cheaper
+        # than running them through the regex rules (and caching the
+        # results).
+        if "](" not in line:
+            continue
+
+        text = line.strip()
+
         # Contains a valid markdown link?
-        if md_link_rule.match(line.strip()):
+        if md_link_rule.match(text):
 
-            results = md_link_rule.extract_data(line.strip())
+            results = md_link_rule.extract_data(text)
 
             # can be multiple links in the line...
             for r in results:
@@ -691,11 +701,9 @@ def extract_all_markdown_links(contents, **kwargs):
 
                     relative_links.append((i, r))
 
-        matches = extract_markdown_image_links(line)
-
-        if matches:
+        if image_rule.match(text):
 
-            for m in matches:
+            for m in image_rule.extract_data(text):
                 image_links.append((i, m))
 
     return all_links, absolute_links, relative_links, image_links
@@ -29,12 +29,19 @@ problems that could occur.
 # ------------
 # System Modules - Included with Python
 
+import os
+import re
+import heapq
+import pickle
 import hashlib
 
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain
+from multiprocessing import Pool
 
-from difflib import get_close_matches
+from difflib import SequenceMatcher
 
 # ------------
 # 3rd Party - From pip
@@ -44,6 +51,16 @@ import click
 from rich.console import Console
 console = Console()
 
+# rapidfuzz is optional. It is much faster than difflib when there are
+# a lot of files to compare against. If it isn't available, we'll fall
+# back to difflib.
+try:
+    from rapidfuzz import process, fuzz
+
+except ImportError:
+    process = None
+    fuzz = None
+
 # ------------
 # Custom Modules
 
@@ -62,83 +79,326 @@ from ..documentos.markdown_classifiers import MarkdownAttributeSyntax
 
 # -------------
 
+# The document lookup and the set of known document paths used by the
+# `links` worker processes. They are set once per worker by
+# `_init_worker` so they aren't pickled for every task.
+_lookup = None
+_known_paths = None
 
-def find_broken_urls(
-    parent=None,
-    links=None,
-):
+# The format of the relative link cache. Bump it whenever the layout of
+# the cache or the way the links are extracted from the Markdown
+# changes, so entries written by an older version are not reused.
+LINK_CACHE_VERSION = 1
+
+# -------------
+
+
+@lru_cache(maxsize=None)
+def _resolved_exists(parent, url):
     """
-    Examine the relative links for the MarkdownDocument object and
-    return a list contain links that don't have matches on the file
-    system.
+    Return True if the `url` relative to the `parent` folder exists on
+    the file system.
 
-    Can work for images or relative links pointing to markdown files.
+    The result is cached. The same relative link tends to show up many
+    times, in the same document and across documents in the same
+    folder, and there is no need to hit the file system for each one.
 
     # Parameters
 
     parent:Path
-        - The path of the parent folder to resolve links
+        - The path of the parent folder to resolve the url
 
-    links:list(tuple)
-        - A list of tuples containing:
-            - line number (0 based)
-            - dict
-                - 'url' - The URL portion of the markdown link
-                - The `url` key is the required and is the URL of the
-                  relative link
+    url:str
+        - The relative url, without any section anchors
+
+    """
+
+    return parent.joinpath(url).resolve().exists()
+
+
+def _difflib_close_matches(key, choices, cutoff=0.8, n=3):
+    """
+    A version of `difflib.get_close_matches` that only computes the
+    ratio once for each choice that passes the quick checks. The
+    standard library version computes it twice for every match.
+
+    - https://docs.python.org/3/library/difflib.html#difflib.get_close_matches
+
+    # Parameters
+
+    key:str
+        - The string to find close matches for
+
+    choices:list(str)
+        - The list of strings to compare `key` against
+
+    cutoff:float
+        - The minimum similarity ratio, in the range [0, 1]
+        - Default - 0.8
+
+    n:int
+        - The maximum number of matches to return
+        - Default - 3
 
     # Return
 
-    a list of tuples that contains the problem link and line number.
+    A list of strings from `choices` sorted from most similar to least
+    similar.
+
+    """
+
+    s = SequenceMatcher()
+    s.set_seq2(key)
+
+    results = []
+
+    for c in choices:
+        s.set_seq1(c)
+
+        if s.real_quick_ratio() >= cutoff and s.quick_ratio() >= cutoff:
+            r = s.ratio()
+
+            if r >= cutoff:
+                results.append((r, c))
+
+    return [c for _, c in heapq.nlargest(n, results)]
 
-    item:
-    - line number (0 based)
-    - dict
-        - 'url' - The URL portion of the markdown link
 
+def close_matches(key, choices, cutoff=0.8, n=3):
     """
+    Return a list of the best `n` matches for `key` from `choices` that
+    have a similarity ratio of at least `cutoff`. The matches are
+    sorted from most similar to least similar.
 
-    problems = []
+    Uses rapidfuzz if it is installed, otherwise difflib.
 
-    for rurl in links:
+    # NOTE
 
-        # we only want the URL, not any section anchors
-        left, _, _ = rurl[1]["url"].partition("#")
+    The rapidfuzz calls pass `processor=None` explicitly. Before
+    rapidfuzz 3.0, `process.extract` lower-cased and stripped the
+    strings by default while `process.cdist` didn't, so the strings
+    are always compared as is, the same as difflib.
 
-        file = parent.joinpath(left).resolve()
+    # Parameters
 
-        if not file.exists():
-            problems.append(rurl)
+    key:str
+        - The string to find close matches for
 
-    return problems
+    choices:list(str)
+        - The list of strings to compare `key` against
 
+    cutoff:float
+        - The minimum similarity ratio, in the range [0, 1], a choice
+          must have to be considered a match
+        - Default - 0.8
+
+    n:int
+        - The maximum number of matches to return
+        - Default - 3
+
+    # Return
+
+    A list of strings from `choices`.
 
-def classify_broken_urls(
-    lookup=None,
-    broken_urls=None,
-):
     """
 
-    Using the lookup dictionary and the list of broken URLS, sort the
-    broken URLS for further processing. Sort them into
+    # Both difflib and rapidfuzz define the ratio as 2*M/(a + b) where M
+    # is the number of matching characters and a and b are the string
+    # lengths. M can't be larger than the shorter string, so anything
+    # with 2*min(a, b) < cutoff*(a + b) can never reach the cutoff. That
+    # is a cheap test that removes most of the choices before the
+    # expensive comparison.
+
+    a = len(key)
+
+    choices = [c for c in choices if 2 * min(a, len(c)) >= cutoff * (a + len(c))]
+
+    # NOTE: A q-gram index doesn't help beyond this. Each insertion or
+    # deletion destroys up to q of the key's q-grams and a ratio of 0.8
+    # still allows (1 - 0.8)*(a + b) edits, so a lossless trigram count
+    # filter can't reject anything that passed the length test above. A
+    # tighter threshold would drop valid suggestions.
+
+    if not choices:
+        return []
+
+    if process is None:
+        return _difflib_close_matches(key, choices, cutoff=cutoff, n=n)
+
+    return [
+        match
+        for match, _, _ in process.extract(
+            key,
+            choices,
+            scorer=fuzz.ratio,
+            processor=None,
+            score_cutoff=cutoff * 100,
+            limit=n,
+        )
+    ]
+
 
-    - `no match` - There is no match on the file system for the URLs
-    - `file match` - There are matching file names on the system
-    - `suggestions` - There are no-matching file names, but some of the
-      file names are close
+def batch_close_matches(keys, choices, cutoff=0.8, n=3):
+    """
+    Find the close matches for a number of keys at once. Returns the
+    same matches as calling `close_matches` for each key.
+
+    If rapidfuzz is installed, the scores for all of the keys are
+    computed with `rapidfuzz.process.cdist` which compares the keys in
+    parallel, in C++ threads outside of the GIL. Otherwise,
+    `close_matches` is called for each key.
 
     # Parameters
 
+    keys:iterable(str)
+        - The strings to find close matches for
+
+    choices:list(str)
+        - The list of strings to compare the keys against
+
+    cutoff:float
+        - The minimum similarity ratio, in the range [0, 1], a choice
+          must have to be considered a match
+        - Default - 0.8
+
+    n:int
+        - The maximum number of matches to return for each key
+        - Default - 3
+
+    # Return
+
+    A dictionary keyed by the key mapped to a list of strings from
+    `choices`, sorted from most similar to least similar.
+
+    """
+
+    keys = list(keys)
+
+    if process is None or not keys or not choices:
+        return {k: close_matches(k, choices, cutoff=cutoff, n=n) for k in keys}
+
+    matches = {}
+
+    # cdist returns the full matrix of scores, process the keys in
+    # blocks to keep it to around a million entries
+    step = max(1, 1_000_000 // len(choices))
+
+    for start in range(0, len(keys), step):
+        block = keys[start : start + step]
+
+        scores = process.cdist(
+            block,
+            choices,
+            scorer=fuzz.ratio,
+            processor=None,
+            score_cutoff=cutoff * 100,
+            workers=-1,
+        )
+
+        # scores below the cutoff are set to 0. Python's sort is stable
+        # so ties stay in `choices` order, the same as process.extract
+        for k, row in zip(block, scores):
+            best = sorted(row.nonzero()[0], key=lambda j: -row[j])[:n]
+            matches[k] = [choices[j] for j in best]
+
+    return matches
+
+
+def suggest_deferred(deferred, lookup=None, choices=None):
+    """
+    Find suggestions for the broken links that `scan_and_classify`
+    deferred. The suggestions for every document are found in one batch
+    with `batch_close_matches`.
+
+    # Parameters
+
+    deferred:list(tuple)
+        - A list of tuples containing a MarkdownDocument and the list
+          of links that were deferred by `scan_and_classify` for it
+
     lookup:dict
         - A dictionary keyed by the file name mapped to a list of
           MarkdownDocument objects that have the same name but
           different paths.
 
-    broken_urls:list
-        - a list of tuples that contains the problem link and line
-          number.
+    choices:list(str)
+        - The list of keys from `lookup` to use for fuzzy matching.
+        - Default - None - The keys of `lookup` are used
+
+    # Return
+
+    A dictionary keyed by `suggestions` and `no_matches`. Each key will
+    contain a list of tuples (MarkdownDocument, list) in the same form as
+    the `results` dictionary used by `display_and_fix_issues`.
+
+    """
+
+    if choices is None:
+        choices = list(lookup.keys())
+
+    suggestions = batch_close_matches(
+        {key for _, links in deferred for key, _ in links},
+        choices,
+        cutoff=0.8,
+    )
+
+    results = {
+        "no_matches": [],
+        "suggestions": [],
+    }
+
+    for md, links in deferred:
+
+        classified = {
+            "no_matches": [],
+            "suggestions": [],
+        }
+
+        for key, problem in links:
 
-        - item:
+            if suggestions[key]:
+                matches = [match for pk in suggestions[key] for match in lookup[pk]]
+                classified["suggestions"].append((problem, matches))
+
+            else:
+                # We don't have a file match or any suggestions - a dead
+                # end :(
+                classified["no_matches"].append((problem, []))
+
+        for k in results:
+            if classified[k]:
+                results[k].append((md, classified[k]))
+
+    return results
+
+
+def scan_and_classify(
+    parent=None,
+    links=None,
+    lookup=None,
+    known_paths=None,
+):
+    """
+    Examine the relative links for a MarkdownDocument object, find the
+    links that don't have matches on the file system and sort them for
+    further processing. Sort them into
+
+    - `file match` - There are matching file names on the system
+    - `deferred` - There are no matching file names. These are handed
+      to `suggest_deferred`, with the deferred links of all the other
+      documents, to look for close matches.
+
+    Can work for images or relative links pointing to markdown files.
+
+    The links are checked and classified in a single pass.
+
+    # Parameters
+
+    parent:Path
+        - The path of the parent folder to resolve links
+
+    links:list(tuple)
+        - A list of tuples containing:
             - line number (0 based)
             - dict
                 - 'full' - The full regex match - [text](link)
@@ -148,43 +408,81 @@ def classify_broken_urls(
                 - "md": result.group("md"),
                 - "section_span": result.span("section"),
                 - "section": section attribute i.e ../file.md#id <- the id portion,
+                - The `url` key is the required and is the URL of the
+                  relative link
+
+    lookup:dict
+        - A dictionary keyed by the file name mapped to a list of
+          MarkdownDocument objects that have the same name but
+          different paths.
+
+    known_paths:set(str)
+        - A set of normalized paths (`os.path.normpath`) that are known
+          to exist. A link that points to one of these paths is valid
+          without having to check the file system. Links that are not
+          in the set are checked against the file system.
+        - Default - None - Check every link against the file system
 
     # Return
 
-    A dictionary keyed by:
+    A tuple containing:
+
+    - A dictionary keyed by:
+        - exact_matches - Direct matches in the file system were found,
+          this is a tuple of the broken url and a list of
+          MarkdownDocument objects
+            - The name of the file has an exact match in the system, or
+              a number of matches
+            - multiple exact matches fount
+        - exact_match - Only one exact match found
 
-    - no_matches - no matches were found, this is a list of the broken
-      urls
-    - exact_matches - Direct matches in the file system were found, this
-      is a tuple of the broken url and a list of MarkdownDocument
-      objects
-        - The name of the file has an exact match in the system, or a
-          number of matches
-        - multiple exact matches fount
-    - exact_match - Only one exact match found
-    - suggestions - Closes matches found in the file system, this is a
-      tuple of the broken url and a list of MarkdownDocument objects
-        - This may not be an ideal case or even correct.
+      Each key will contain a list of tuples: (tuple, list)
+        - tuple - the broken link, the same tuple that was in `links`
+        - list - the list of Path objects that match
 
-    Each key will contain a list of tuples: (dict, list)
-    - dict - this is the same dict that was in the broken_urls list
-    - list - the list of Path objects that match or are similar
+    - A list of the broken links without an exact match. Each item is a
+      tuple of the file name (the key to search for) and the broken
+      link.
 
     """
 
     results = {
-        "no_matches": [],
-        "suggestions": [],
         "exact_match": [],
         "exact_matches": [],
     }
 
-    for problem in broken_urls:
+    deferred = []
+
+    # This loop runs for every link in every document. os.path works on
+    # plain strings and is a lot cheaper than building pathlib objects
+    # for each link.
+    parent_str = os.fspath(parent)
+
+    for problem in links:
         line, url = problem
 
         # we only want the URL, not any section anchors
         left, _, _ = url["url"].partition("#")
 
+        # NOTE: normpath collapses `..` on the text of the path and
+        # doesn't follow symlinks the way `resolve()` does. If `linkdir`
+        # is a symlink, `linkdir/../x.md` is accepted here when `x.md`
+        # sits next to `linkdir`, even though the file system would
+        # resolve it relative to the symlink target. That is how a
+        # browser resolves the relative URL in the rendered HTML, so we
+        # accept the difference for the speed. Links that miss the set
+        # are still checked with `resolve()`.
+        if (
+            known_paths is not None
+            and os.path.normpath(os.path.join(parent_str, left)) in known_paths
+        ):
+            continue
+
+        if _resolved_exists(parent, left):
+            continue
+
+        # The link is broken, classify it
+
         key = Path(left).name
 
         if key in lookup:
@@ -198,22 +496,151 @@ def classify_broken_urls(
                 results["exact_matches"].append((problem, matches))
 
         else:
-            # https://docs.python.org/3/library/difflib.html#difflib.get_close_matches
+            # suggestions are found later, for all documents at once
+            deferred.append((key, problem))
 
-            # Can we suggest anything?
-            suggestions = get_close_matches(key, lookup.keys(), cutoff=0.8)
+    return results, deferred
 
-            if suggestions:
-                results["suggestions"].append(
-                    (problem, [match for pk in suggestions for match in lookup[pk]])
-                )
 
-            else:
-                # We don't have a file match or any suggestions - a dead
-                # end :(
-                results["no_matches"].append((problem, []))
+def load_link_cache(path):
+    """
+    Load the relative link cache written by `save_link_cache`.
 
-    return results
+    # Parameters
+
+    path:Path
+        - The path to the cache file
+
+    # Return
+
+    A dictionary keyed by the Markdown file path mapped to a tuple:
+    - tuple(int, int) - The modification time (ns) and size of the file
+      when the links were extracted
+    - list - The relative links of the file, see
+      `MarkdownDocument.relative_links`
+
+    An empty dictionary is returned if the cache doesn't exist, can't
+    be read or was written for a different `LINK_CACHE_VERSION`.
+
+    """
+
+    try:
+        with path.open("rb") as fin:
+            data = pickle.load(fin)
+
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return {}
+
+    if not isinstance(data, dict) or data.get("version") != LINK_CACHE_VERSION:
+        return {}
+
+    return data.get("links", {})
+
+
+def save_link_cache(path, cache):
+    """
+    Write the relative link cache to disk along with the
+    `LINK_CACHE_VERSION`. The cache is written to a temporary file first
+    and then renamed so an interrupted run can't leave a partially
+    written cache behind.
+
+    # Parameters
+
+    path:Path
+        - The path to the cache file
+
+    cache:dict
+        - The cache dictionary, see `load_link_cache`
+
+    """
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    tmp = path.with_suffix(".tmp")
+
+    with tmp.open("wb") as fo:
+        pickle.dump(
+            {"version": LINK_CACHE_VERSION, "links": cache},
+            fo,
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+
+    tmp.replace(path)
+
+
+def _init_worker(lookup, known_paths):
+    """
+    Initialize a `links` worker process with the document lookup
+    dictionary.
+
+    # Parameters
+
+    lookup:dict
+        - A dictionary keyed by the file name mapped to a list of
+          MarkdownDocument objects that have the same name but
+          different paths.
+
+    known_paths:set(str)
+        - The normalized paths of all the Markdown documents
+
+    """
+
+    global _lookup, _known_paths
+    _lookup = lookup
+    _known_paths = known_paths
+
+    _resolved_exists.cache_clear()
+
+
+def _scan_one(item):
+    """
+    Find and classify the broken relative links of a single Markdown
+    file. This is the unit of work for the multiprocessing pool used by
+    the `links` command.
+
+    # Parameters
+
+    item:tuple(int, Path, list)
+        - The index of the document in the list of documents
+        - The path to the Markdown file
+        - The cached relative links of the file or None if the file has
+          to be read
+
+    # Return
+
+    A tuple containing:
+    - the index of the document
+    - the dictionary returned by `scan_and_classify`
+    - the relative links if they were read from the file, otherwise
+      None
+    - the list of links deferred for fuzzy matching
+
+    # NOTE
+
+    The index is sent back instead of the MarkdownDocument, so the
+    document's contents (all of its lines) are never pickled back to the
+    main process. The relative links of a document that had to be read
+    are sent back so they can be stored in the link cache. Documents
+    whose links came from the cache only send back the index and their
+    results.
+
+    """
+
+    i, filename, links = item
+
+    parsed = None
+
+    if links is None:
+        links = parsed = MarkdownDocument(filename).relative_links()
+
+    classified, deferred = scan_and_classify(
+        filename.parent,
+        links,
+        lookup=_lookup,
+        known_paths=_known_paths,
+    )
+
+    return i, classified, parsed, deferred
 
 
 def display_classified_url(results, root=None):
@@ -260,8 +687,8 @@ def write_corrected_url(
     md:MarkdownDocument
         - The document we need to correct the URLs
 
-    problems:list(dict, list)
-        - dict - this is the same dict that was in the broken_urls list
+    problems:list(tuple, list)
+        - tuple - the broken link as returned by `scan_and_classify`
         - list - the list of Path objects that match or are similar
 
     root:Path
@@ -271,6 +698,10 @@ def write_corrected_url(
 
     console.print(f"File: {md.filename.relative_to(root)}")
 
+    # Group the replacements by line so each line is only rewritten once,
+    # no matter how many broken links it contains.
+    replacements = {}
+
     for defect, matches in problems:
         line, url = defect
 
@@ -286,20 +717,39 @@ def write_corrected_url(
         ).joinpath(match.name)
 
         left, _, _ = url["url"].partition("#")
-        new_line = md.contents[line].replace(left, str(new_url))
+        replacements.setdefault(line, {})[left] = str(new_url)
 
         console.print(f"Line: {line} - Replacing `{left}` -> `{new_url}`")
 
-        md.contents[line] = new_line
+    for line, mapping in replacements.items():
+
+        # Most lines only have one broken link, str.replace is the
+        # cheapest way to deal with them.
+        if len(mapping) == 1:
+            for old, new in mapping.items():
+                md.contents[line] = md.contents[line].replace(old, new)
+
+            continue
+
+        # Match the longest URLs first so a URL that is the tail of
+        # another one (`file.md` and `../file.md`) doesn't clobber it.
+        # Substituting in a single pass also means a replacement is
+        # never replaced again.
+        pattern = re.compile(
+            "|".join(re.escape(k) for k in sorted(mapping, key=len, reverse=True))
+        )
+
+        md.contents[line] = pattern.sub(
+            lambda m: mapping[m.group(0)],
+            md.contents[line],
+        )
 
     if dry_run:
         console.print("------DRY-RUN------")
 
     else:
         with md.filename.open("w", encoding="utf-8") as fo:
-
-            for line in md.contents:
-                fo.write(line)
+            fo.write("".join(md.contents))
 
             console.print("Changes written...")
 
@@ -493,9 +943,7 @@ def repair_header_issues(
 
     else:
         with md.filename.open("w", encoding="utf-8") as fo:
-
-            for line in md.contents:
-                fo.write(line)
+            fo.write("".join(md.contents))
 
             console.print("Changes written...")
 
@@ -577,6 +1025,12 @@ def links(*args, **kwargs):
     console.print("")
 
     lookup = document_lookup(config["md_files"])
+    filenames = [md.filename for md in config["md_files"]]
+
+    # Most relative links point to Markdown documents we have already
+    # found. Checking against this set avoids a file system hit for
+    # each of them.
+    known_paths = {os.path.normpath(f) for f in filenames}
 
     results = {
         "no_matches": [],
@@ -585,18 +1039,116 @@ def links(*args, **kwargs):
         "exact_matches": [],
     }
 
-    for md in config["md_files"]:
-        sorted_broken_urls = classify_broken_urls(
-            lookup=lookup,
-            broken_urls=find_broken_urls(
-                md.filename.parent,
-                md.relative_links(),
-            ),
-        )
+    # -----------
+    # Link Cache
+
+    # Reading and parsing every document is the bulk of the work. The
+    # relative links of each document are cached between runs, keyed by
+    # the file's modification time and size, so only new or changed
+    # documents are read again. Repaired documents are rewritten, which
+    # invalidates their entries.
+
+    # use a cache per documents folder
+    folder_hash = (
+        hashlib.sha256(str(config["documents.path"]).encode("utf-8"))
+        .hexdigest()[:10]
+        .lower()
+    )
+
+    cache_file = config["cache_folder"].joinpath(f"repair.links.{folder_hash}.pickle")
+
+    link_cache = load_link_cache(cache_file)
+    new_cache = {}
+
+    items = []
+    costs = {}
 
-        for key in results:
-            if sorted_broken_urls[key]:
-                results[key].append((md, sorted_broken_urls[key]))
+    for i, f in enumerate(filenames):
+        st = f.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+
+        cached = link_cache.get(f)
+
+        if cached is not None and cached[0] == stamp:
+            new_cache[f] = cached
+            items.append((i, f, cached[1]))
+            costs[i] = 0
+
+        else:
+            new_cache[f] = (stamp, None)
+            items.append((i, f, None))
+            costs[i] = st.st_size
+
+    # -----------
+    # Multi-Processing
+
+    # Each document is independent so we can scan them in parallel. The
+    # lookup is handed to each worker once through the initializer
+    # instead of being pickled with every task.
+
+    # The results are consumed as they finish, in whatever order, so we
+    # don't have to hold the scan of every document in memory at once.
+    # Most documents don't have any broken links and are dropped right
+    # away.
+
+    # The workers only need the file names, and any cached links, and
+    # send back the index of the document in `md_files`, not the
+    # document itself.
+
+    # Hand out the largest documents that have to be read first, one at
+    # a time, so a big document doesn't start last and keep one worker
+    # busy while the others sit idle. The rest are handed out in chunks.
+
+    workers = os.cpu_count() or 1
+
+    items.sort(key=lambda item: costs[item[0]], reverse=True)
+
+    head = items[: 2 * workers]
+    tail = items[2 * workers :]
+
+    chunksize = max(1, len(tail) // (4 * workers))
+
+    deferred = []
+
+    with Pool(
+        processes=None,
+        initializer=_init_worker,
+        initargs=(lookup, known_paths),
+    ) as p:
+
+        for i, sorted_broken_urls, parsed, links in chain(
+            p.imap_unordered(_scan_one, head, chunksize=1),
+            p.imap_unordered(_scan_one, tail, chunksize=chunksize),
+        ):
+            md = config["md_files"][i]
+
+            if parsed is not None:
+                new_cache[md.filename] = (new_cache[md.filename][0], parsed)
+
+            if links:
+                deferred.append((md, links))
+
+            for key, problems in sorted_broken_urls.items():
+                if problems:
+                    results[key].append((md, problems))
+
+    # Find suggestions for all of the broken links without an exact
+    # match in one batch
+    for key, found in suggest_deferred(deferred, lookup).items():
+        results[key].extend(found)
+
+    # Put the documents back in a predictable order for display
+    for key in results:
+        results[key].sort(key=lambda item: item[0])
+
+    # The cache is only an optimization, don't let a problem writing it
+    # stop the repairs
+    try:
+        save_link_cache(cache_file, new_cache)
+
+    except OSError as e:
+        console.print(f"WARNING: Could not write the link cache `{cache_file}` - {e}")
+        console.print("")
 
     display_and_fix_issues(
         results, root=config["documents.path"], dry_run=config["dry_run"]
@@ -651,6 +1203,8 @@ def images(*args, **kwargs):
     for img in images:
         reverse_image_lookup.setdefault(img.name, []).append(img)
 
+    _resolved_exists.cache_clear()
+
     results = {
         "no_matches": [],
         "suggestions": [],
@@ -658,18 +1212,24 @@ def images(*args, **kwargs):
         "exact_matches": [],
     }
 
+    deferred = []
+
     for md in config["md_files"]:
-        sorted_broken_urls = classify_broken_urls(
+        sorted_broken_urls, links = scan_and_classify(
+            md.filename.parent,
+            md.image_links(),
             lookup=reverse_image_lookup,
-            broken_urls=find_broken_urls(
-                md.filename.parent,
-                md.image_links(),
-            ),
         )
 
-        for key in results:
-            if sorted_broken_urls[key]:
-                results[key].append((md, sorted_broken_urls[key]))
+        if links:
+            deferred.append((md, links))
+
+        for key, problems in sorted_broken_urls.items():
+            if problems:
+                results[key].append((md, problems))
+
+    for key, found in suggest_deferred(deferred, reverse_image_lookup).items():
+        results[key].extend(found)
 
     display_and_fix_issues(
         results, root=config["documents.path"], dry_run=config["dry_run"]
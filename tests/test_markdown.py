@@ -24,6 +24,7 @@ from documentos.documentos.markdown import (
     extract_relative_markdown_links,
     extract_markdown_image_links,
     extract_relative_markdown_image_links,
+    extract_all_markdown_links,
 )
 
 # -----------
@@ -416,3 +417,38 @@ def test_extract_relative_markdown_image_links(data):
         assert r["full"] == o["full"]
         assert r["caption"] == o["caption"]
         assert r["url"] == o["url"]
+
+
+# ----------
+# extract_all_markdown_links
+
+
+def test_extract_all_markdown_links():
+    contents = [
+        "# Title\n",
+        "\n",
+        "See [the docs](https://example.com) and [setup](./setup.md#install).\n",
+        "No links on this line.\n",
+        "![A sunset](./assets/sunset.jpg)\n",
+        "```\n",
+        "[inside a fence](./fence.md)\n",
+        "```\n",
+        "Brackets [but] (not a link)\n",
+    ]
+
+    all_links, absolute_links, relative_links, image_links = extract_all_markdown_links(
+        contents
+    )
+
+    assert [(i, r["url"]) for i, r in all_links] == [
+        (2, "https://example.com"),
+        (2, "./setup.md#install"),
+    ]
+
+    assert [(i, r["url"]) for i, r in absolute_links] == [(2, "https://example.com")]
+
+    assert [(i, r["md"], r["section"]) for i, r in relative_links] == [
+        (2, "./setup.md", "#install")
+    ]
+
+    assert [(i, r["url"]) for i, r in image_links] == [(4, "./assets/sunset.jpg")]
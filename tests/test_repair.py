@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+"""
+-----------
+SPDX-License-Identifier: MIT
+Copyright (c) 2021 Troy Williams
+
+uuid       =
+author     = Troy Williams
+email      = troy.williams@bluebill.net
+date       =
+-----------
+
+"""
+
+import pytest
+import random
+
+from difflib import get_close_matches
+
+from documentos.documentos.document import MarkdownDocument
+
+from documentos.tools import repair
+
+from documentos.tools.repair import (
+    write_corrected_url,
+    load_link_cache,
+    save_link_cache,
+    close_matches,
+    batch_close_matches,
+    _difflib_close_matches,
+)
+
+# ---------
+# write_corrected_url
+
+
+def test_write_corrected_url_multiple_links_on_a_line(tmp_path):
+    # `unique.md` is the tail of `x/unique.md`. Replacing one must not
+    # clobber the other.
+
+    tmp_path.joinpath("a/b").mkdir(parents=True)
+    target = tmp_path.joinpath("a/b/unique.md")
+    target.write_text("# Unique\n", encoding="utf-8")
+
+    md_file = tmp_path.joinpath("index.md")
+    md_file.write_text(
+        "# Index\n[bad](unique.md#sec) and [bad2](x/unique.md)\n",
+        encoding="utf-8",
+    )
+
+    md = MarkdownDocument(md_file)
+
+    problems = [
+        ((1, {"url": "unique.md#sec"}), [target]),
+        ((1, {"url": "x/unique.md"}), [target]),
+    ]
+
+    write_corrected_url(md, problems, root=tmp_path, dry_run=False)
+
+    expected = "# Index\n[bad](a/b/unique.md#sec) and [bad2](a/b/unique.md)\n"
+
+    assert md.contents[1] == expected.splitlines(keepends=True)[1]
+    assert md_file.read_text(encoding="utf-8") == expected
+
+
+def test_write_corrected_url_single_link_dry_run(tmp_path):
+
+    tmp_path.joinpath("a").mkdir()
+    target = tmp_path.joinpath("a/target.md")
+    target.write_text("# Target\n", encoding="utf-8")
+
+    original = "[link](target.md) and [link](target.md)\n"
+
+    md_file = tmp_path.joinpath("index.md")
+    md_file.write_text(original, encoding="utf-8")
+
+    md = MarkdownDocument(md_file)
+
+    problems = [((0, {"url": "target.md"}), [MarkdownDocument(target)])]
+
+    write_corrected_url(md, problems, root=tmp_path, dry_run=True)
+
+    assert md.contents[0] == "[link](a/target.md) and [link](a/target.md)\n"
+
+    # dry run - nothing written
+    assert md_file.read_text(encoding="utf-8") == original
+
+
+# ---------
+# load_link_cache/save_link_cache
+
+
+def test_link_cache_round_trip(tmp_path):
+    cache_file = tmp_path.joinpath("cache/links.pickle")
+
+    # missing cache
+    assert load_link_cache(cache_file) == {}
+
+    cache = {tmp_path.joinpath("index.md"): ((1, 2), [(0, {"url": "a.md"})])}
+
+    save_link_cache(cache_file, cache)
+
+    assert load_link_cache(cache_file) == cache
+
+
+def test_link_cache_version_mismatch(tmp_path, monkeypatch):
+    cache_file = tmp_path.joinpath("links.pickle")
+
+    save_link_cache(cache_file, {tmp_path.joinpath("index.md"): ((1, 2), [])})
+
+    monkeypatch.setattr(repair, "LINK_CACHE_VERSION", repair.LINK_CACHE_VERSION + 1)
+
+    assert load_link_cache(cache_file) == {}
+
+
+# ---------
+# close_matches/batch_close_matches/_difflib_close_matches
+
+# A fixed set of file names and keys that are one character away from
+# one of them, or not close to anything.
+
+rng = random.Random(3687)
+
+choices = [
+    "".join(rng.choices("abcdefg_-", k=rng.randint(1, 25))) + ".md"
+    for _ in range(200)
+]
+
+keys = []
+
+for _ in range(50):
+    k = rng.choice(choices)
+    i = rng.randrange(len(k))
+    keys.append(k[:i] + k[i + 1 :])
+
+keys.extend(["nothing_like_it.md", "x", ""])
+
+# run each test with rapidfuzz (if installed) and with the difflib
+# fallback
+backends = [
+    pytest.param(
+        "rapidfuzz",
+        marks=pytest.mark.skipif(
+            repair.process is None, reason="rapidfuzz is not installed"
+        ),
+    ),
+    "difflib",
+]
+
+
+@pytest.fixture(params=backends)
+def backend(request, monkeypatch):
+    if request.param == "difflib":
+        monkeypatch.setattr(repair, "process", None)
+
+    return request.param
+
+
+def test_close_matches(backend):
+    assert close_matches("anther_doc.md", ["another_doc.md", "x.md"]) == [
+        "another_doc.md"
+    ]
+
+    assert close_matches("zzzzzzzzz.md", ["another_doc.md", "x.md"]) == []
+
+
+def test_batch_close_matches(backend):
+    results = batch_close_matches(keys, choices)
+
+    assert set(results) == set(keys)
+
+    for k in keys:
+        assert results[k] == close_matches(k, choices)
+
+    # make sure we are actually finding matches
+    assert sum(1 for k in keys if results[k]) > len(keys) // 2
+
+
+def test_batch_close_matches_empty(backend):
+    assert batch_close_matches([], choices) == {}
+    assert batch_close_matches(["a.md"], []) == {"a.md": []}
+
+
+@pytest.mark.parametrize("n", [1, 3, 5])
+@pytest.mark.parametrize("cutoff", [0.6, 0.8])
+def test_difflib_close_matches(cutoff, n):
+    for k in keys:
+        assert _difflib_close_matches(
+            k, choices, cutoff=cutoff, n=n
+        ) == get_close_matches(k, choices, n=n, cutoff=cutoff)
+
+
+def test_difflib_fallback(monkeypatch):
+    # without rapidfuzz, close_matches is the standard library result
+    monkeypatch.setattr(repair, "process", None)
+
+    for k in keys:
+        assert close_matches(k, choices) == get_close_matches(k, choices, cutoff=0.8)